@@ -12,7 +12,7 @@ Features:
 - Each step is explained with comments above the relevant code blocks
 
 Run:
-1) Install pygame if needed: pip install pygame
+1) Install dependencies if needed: pip install pygame numpy
 
 Notes: audio is optional — placeholders included so you can drop in sound files if desired.
 """
@@ -22,8 +22,11 @@ import os
 import random
 import sys
 import time
+from collections import OrderedDict
 
+import numpy as np
 import pygame
+from pygame._sdl2.video import Renderer, Texture, Window
 
 # -----------------------------
 # CONFIGURATION / CONSTANTS
@@ -45,6 +48,10 @@ PIPE_MIN_TOP = 90
 PIPE_SPEED_BASE = 180.0  # pixels per second (will scale with difficulty)
 PIPE_SPAWN_INTERVAL = 1.6  # seconds between pipes (scales with difficulty)
 
+# Particle settings (radius shrinks from max to min as a particle fades out)
+PARTICLE_MIN_RADIUS = 3
+PARTICLE_MAX_RADIUS = 8
+
 # Power-up settings
 POWERUP_TYPES = ["shield", "slow", "score"]
 POWERUP_RADIUS = 12
@@ -60,6 +67,8 @@ HIGH_SCORE_FILE = "bird_highscore.txt"
 SKY_TOP = (135, 206, 235)
 SKY_BOTTOM = (255, 250, 240)
 GROUND_COLOR = (90, 56, 34)
+GROUND_HEIGHT = 90
+GROUND_TILE_W = 40
 PIPE_PALETTE = [
     (239, 71, 111),  # pink/red
     (255, 209, 102), # warm yellow
@@ -73,7 +82,20 @@ POWERUP_COLORS = {
     "score": (255, 102, 178),  # pink
 }
 
+# Sine lookup table for cheap per-frame bobbing (power of two size so we can mask the index)
+SIN_LUT_SIZE = 1024
+SIN_LUT_MASK = SIN_LUT_SIZE - 1
+SIN_LUT_SCALE = SIN_LUT_SIZE / (2 * math.pi)
+SIN_LUT = [math.sin(i / SIN_LUT_SCALE) for i in range(SIN_LUT_SIZE)]
+
 # Fonts (created later after pygame.init())
+FONT_SIZES = (18, 20, 22, 28, 30, 34, 42, 48, 56)  # every size passed to draw_text
+TEXT_CACHE_SIZE = 128  # max number of rendered text surfaces (and textures) kept around
+
+# Caches for draw_text: fonts by size and rendered surfaces by (text, size, color).
+# Text textures live in the game's TextureCache, since they belong to its renderer.
+_font_cache = {}
+_text_cache = OrderedDict()
 
 # -----------------------------
 # HELPER FUNCTIONS
@@ -102,29 +124,113 @@ def save_highscore(score):
         pass
 
 
-def draw_text(surf, text, size, pos, color=(10, 10, 10), center=False):
-    """Convenience to draw text on a surface. Fonts are created in Game.__init__"""
-    font = pygame.font.SysFont(None, size)
-    surf_t = font.render(text, True, color)
-    rect = surf_t.get_rect()
+def _get_font(size):
+    """Return a cached SysFont for the given size, creating it on first use."""
+    font = _font_cache.get(size)
+    if font is None:
+        font = _font_cache[size] = pygame.font.SysFont(None, size)
+    return font
+
+
+def render_text(text, size, color=(10, 10, 10)):
+    """Render text to a surface, reusing a previous render of the same (text, size, color).
+    The cache is a small LRU so changing strings (score, timers) can't grow it forever.
+    """
+    key = (text, size, color)
+    surf_t = _text_cache.get(key)
+    if surf_t is None:
+        surf_t = _get_font(size).render(text, True, color)
+        _text_cache[key] = surf_t
+        if len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surf_t
+
+
+class TextureCache:
+    """Textures uploaded to one renderer, kept for as long as the game that owns it.
+    Objects look their textures up by a key of their choosing (e.g. ("pipe", color)) and
+    store them on a miss; text textures get their own small LRU.
+    """
+
+    def __init__(self, renderer):
+        self.renderer = renderer
+        self._store = {}
+        self._text = OrderedDict()
+
+    def get(self, key):
+        """Return whatever was stored under key, or None."""
+        return self._store.get(key)
+
+    def put(self, key, value):
+        """Store value (a texture or a collection of textures) under key and return it."""
+        self._store[key] = value
+        return value
+
+    def upload(self, surf):
+        """Upload a pre-rendered surface to the renderer as a texture."""
+        return Texture.from_surface(self.renderer, surf)
+
+    def text(self, text, size, color=(10, 10, 10)):
+        """Like render_text, but returns a texture (LRU cached per (text, size, color))."""
+        key = (text, size, color)
+        tex = self._text.get(key)
+        if tex is None:
+            tex = self._text[key] = self.upload(render_text(text, size, color))
+            if len(self._text) > TEXT_CACHE_SIZE:
+                self._text.popitem(last=False)
+        else:
+            self._text.move_to_end(key)
+        return tex
+
+
+def draw_text(target, text, size, pos, color=(10, 10, 10), center=False):
+    """Convenience to draw text on a surface or through a TextureCache's renderer.
+    Fonts and rendered text are cached.
+    """
+    if isinstance(target, TextureCache):
+        image = target.text(text, size, color)
+        dest = target.renderer
+    else:
+        image = render_text(text, size, color)
+        dest = target
+    rect = image.get_rect()
     if center:
         rect.center = pos
     else:
         rect.topleft = pos
-    surf.blit(surf_t, rect)
+    dest.blit(image, rect)
 
 
-def circle_rect_collision(circle_pos, circle_rad, rect):
-    """Check collision between a circle and a rectangle.
-    This is used for bird (circle) vs pipe (rect) collision tests.
+def first_pipe_hit(circle, pipes, lo=-math.inf, hi=math.inf):
+    """Return the index of the first pipe whose top or bottom rect touches the circle, or -1.
+    This is the bird (circle) vs pipe (rect) collision test, done in one loop with plain
+    arithmetic: closest point on each rect to the circle center, compared against the radius.
+    Pipes entirely outside the x-range [lo, hi] are skipped before any math.
     """
-    cx, cy = circle_pos
-    # find closest point on rect to circle center
-    closest_x = clamp(cx, rect.left, rect.right)
-    closest_y = clamp(cy, rect.top, rect.bottom)
-    dx = cx - closest_x
-    dy = cy - closest_y
-    return (dx * dx + dy * dy) <= (circle_rad * circle_rad)
+    cx, cy, cr = circle
+    r2 = cr * cr
+    for i, pipe in enumerate(pipes):
+        # integer edges, matching where Pipe.draw puts the pipe on screen
+        left = int(pipe.x)
+        right = left + pipe.width
+        if right < lo or left > hi:
+            continue
+        dx = cx - (left if cx < left else right if cx > right else cx)
+        dx2 = dx * dx
+        # top rect spans y in [0, top]
+        top = int(pipe.top)
+        dy = cy - (0 if cy < 0 else top if cy > top else cy)
+        if dx2 + dy * dy <= r2:
+            return i
+        # bottom rect spans y in [bottom_y, bottom_y + height]
+        bottom_y = int(pipe.top + pipe.gap)
+        bottom = bottom_y + int(HEIGHT - (pipe.top + pipe.gap))
+        dy = cy - (bottom_y if cy < bottom_y else bottom if cy > bottom else cy)
+        if dx2 + dy * dy <= r2:
+            return i
+    return -1
 
 
 # -----------------------------
@@ -134,9 +240,12 @@ def circle_rect_collision(circle_pos, circle_rad, rect):
 class Bird:
     """Represents the player's bird with physics, tilt/rotation and visual state.
     We intentionally avoid external sprite files and draw the bird using pygame primitives
-    so the file is self-contained.
+    so the file is self-contained; the primitives are rasterized once into cached sprites.
     """
 
+    # pre-rendered sprites indexed by wing bob offset (textures live in the game's TextureCache)
+    _sprite_cache = None
+
     def __init__(self, x, y):
         # Position stored as floats for smooth movement
         self.x = float(x)
@@ -163,35 +272,56 @@ class Bird:
         # update flap animation phase towards 0
         self.flap_phase = max(0.0, self.flap_phase - dt * 3.0)
 
-    def draw(self, surf, angle_mul=1.0):
-        """Draw the bird as a circle with an eye and a simple wing. Rotate/tilt based on velocity.
+    @classmethod
+    def build_sprites(cls, radius=BIRD_RADIUS):
+        """Rasterize the bird once per wing-bob offset (0..2 px) into small alpha surfaces.
+        draw() then only has to draw one of these, rotated, instead of drawing primitives.
+        """
+        pad = 8
+        size = 2 * (radius + pad)
+        c = radius + pad  # sprite-local center of the body
+        sprites = []
+        for bob in range(3):
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+
+            # Body
+            pygame.draw.circle(s, (255, 215, 64), (c, c), radius)  # bright body
+            pygame.draw.circle(s, (10, 10, 10), (c, c), radius, 2)  # outline
+
+            # Eye (slightly above center)
+            eye_x = int(c + radius * 0.3)
+            eye_y = int(c - radius * 0.35)
+            pygame.draw.circle(s, (255, 255, 255), (eye_x, eye_y), max(2, radius // 6))
+            pygame.draw.circle(s, (10, 10, 10), (eye_x, eye_y), max(1, radius // 12))
+
+            # Wing: a small triangle offset vertically by the bob amount
+            wing_color = (255, 170, 44)
+            wing_points = [
+                (c - 6, c + 2 + bob),
+                (c - 22, c - 6 + bob),
+                (c - 12, c - 2 + bob),
+            ]
+            pygame.draw.polygon(s, wing_color, wing_points)
+            pygame.draw.polygon(s, (10, 10, 10), wing_points, 1)
+            sprites.append(s)
+        cls._sprite_cache = sprites
+        return sprites
+
+    def draw(self, textures, angle_mul=1.0):
+        """Draw the bird from its cached sprite texture, rotated to tilt based on velocity.
         angle_mul allows external scaling of rotation for visual effect.
         """
+        texs = textures.get("bird")
+        if texs is None:
+            sprites = Bird._sprite_cache or Bird.build_sprites(self.radius)
+            texs = textures.put("bird", [textures.upload(s) for s in sprites])
         # compute tilt angle (more negative vel -> tilt up)
         angle = clamp(-self.vel / 600.0 * 45.0 * angle_mul, -45, 60)
 
-        # Body
-        body_center = (int(self.x), int(self.y))
-        pygame.draw.circle(surf, (255, 215, 64), body_center, self.radius)  # bright body
-        pygame.draw.circle(surf, (10, 10, 10), body_center, self.radius, 2)  # outline
-
-        # Eye (slightly above center)
-        eye_x = int(self.x + self.radius * 0.3)
-        eye_y = int(self.y - self.radius * 0.35)
-        pygame.draw.circle(surf, (255, 255, 255), (eye_x, eye_y), max(2, self.radius // 6))
-        pygame.draw.circle(surf, (10, 10, 10), (eye_x, eye_y), max(1, self.radius // 12))
-
-        # Wing: we draw a rotated ellipse manually by offsetting a polygon
         # wing bob amplitude depends on flap_phase
-        bob = int(self.flap_phase * 6)
-        wing_color = (255, 170, 44)
-        wing_points = [
-            (self.x - 6, self.y + 2 + bob),
-            (self.x - 22, self.y - 6 + bob),
-            (self.x - 12, self.y - 2 + bob),
-        ]
-        pygame.draw.polygon(surf, wing_color, wing_points)
-        pygame.draw.polygon(surf, (10, 10, 10), wing_points, 1)
+        tex = texs[min(int(self.flap_phase * 6), len(texs) - 1)]
+        # the renderer rotates clockwise, so negate to tilt counter-clockwise (nose up)
+        tex.draw(dstrect=tex.get_rect(center=(int(self.x), int(self.y))), angle=-angle)
 
     def get_circle(self):
         """Return current circle (x, y, r) for collision checks."""
@@ -213,30 +343,41 @@ class Pipe:
         """Move pipe left by speed (px/sec)."""
         self.x -= speed * dt
 
-    def draw(self, surf):
-        """Render the top and bottom pipes with a stylized rim and shadow."""
-        # Top rect
-        top_rect = pygame.Rect(int(self.x), 0, self.width, int(self.top))
-        bottom_rect = pygame.Rect(int(self.x), int(self.top + self.gap), self.width, int(HEIGHT - (self.top + self.gap)))
-
-        # draw body
-        pygame.draw.rect(surf, self.color, top_rect)
-        pygame.draw.rect(surf, self.color, bottom_rect)
-
-        # add lighter rim at inner edges to give depth
-        rim_w = 8
-        rim_color = tuple(min(255, c + 30) for c in self.color)
-        # bottom of top pipe
-        pygame.draw.rect(surf, rim_color, (int(self.x), int(self.top - rim_w), self.width, rim_w))
-        # top of bottom pipe
-        pygame.draw.rect(surf, rim_color, (int(self.x), int(self.top + self.gap), self.width, rim_w))
+    @staticmethod
+    def textures(textures, color, width=PIPE_WIDTH):
+        """Return (top, bottom) full-height pipe textures for a color, rendering them once.
+        The top texture has its lighter rim along the bottom edge and the bottom texture along
+        the top edge, so any pipe is just a slice of each.
+        """
+        texs = textures.get(("pipe", color))
+        if texs is None:
+            # add lighter rim at inner edges to give depth
+            rim_w = 8
+            rim_color = tuple(min(255, c + 30) for c in color)
+            top = pygame.Surface((width, HEIGHT))
+            top.fill(color)
+            top.fill(rim_color, (0, HEIGHT - rim_w, width, rim_w))
+            bottom = pygame.Surface((width, HEIGHT))
+            bottom.fill(color)
+            bottom.fill(rim_color, (0, 0, width, rim_w))
+            texs = textures.put(("pipe", color), (textures.upload(top), textures.upload(bottom)))
+        return texs
+
+    def draw(self, textures):
+        """Render the top and bottom pipes by drawing slices of the cached textures."""
+        top_tex, bottom_tex = Pipe.textures(textures, self.color, self.width)
+        x = int(self.x)
+        top_h = int(self.top)
+        bottom_y = int(self.top + self.gap)
+        bottom_h = HEIGHT - bottom_y
+        # top pipe: bottom-most top_h rows of the top texture (ends with the rim)
+        top_tex.draw(srcrect=(0, HEIGHT - top_h, self.width, top_h), dstrect=(x, 0, self.width, top_h))
+        # bottom pipe: upper rows of the bottom texture (starts with the rim)
+        bottom_tex.draw(srcrect=(0, 0, self.width, bottom_h), dstrect=(x, bottom_y, self.width, bottom_h))
 
     def collides_with_circle(self, circle):
         """Check if the pipe collides with a circle (bird)."""
-        cx, cy, cr = circle
-        top_rect = pygame.Rect(int(self.x), 0, self.width, int(self.top))
-        bottom_rect = pygame.Rect(int(self.x), int(self.top + self.gap), self.width, int(HEIGHT - (self.top + self.gap)))
-        return circle_rect_collision((cx, cy), cr, top_rect) or circle_rect_collision((cx, cy), cr, bottom_rect)
+        return first_pipe_hit(circle, [self]) == 0
 
     def off_screen(self):
         return self.x + self.width < -40
@@ -252,17 +393,26 @@ class PowerUp:
         self.radius = POWERUP_RADIUS
         self.collected = False
 
-    def update(self, dt, speed):
+    def update(self, dt, speed, phase=0.0):
+        """Drift left and bob; phase is the shared bobbing phase advanced by Game.update."""
         # power-ups drift left with the pipes
         self.x -= speed * dt
-        # small bobbing motion
-        self.y += math.sin(time.time() * 4.0 + self.x) * 8 * dt
-
-    def draw(self, surf):
-        c = POWERUP_COLORS.get(self.type, (255, 255, 255))
-        pygame.draw.circle(surf, c, (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(surf, (10, 10, 10), (int(self.x), int(self.y)), self.radius, 2)
-        draw_text(surf, self.type[0].upper(), 20, (int(self.x) - 6, int(self.y) - 10), color=(10, 10, 10))
+        # small bobbing motion (sine via lookup table, offset by x so they don't bob in sync)
+        self.y += SIN_LUT[int((phase + self.x) * SIN_LUT_SCALE) & SIN_LUT_MASK] * 8 * dt
+
+    def draw(self, textures):
+        # texture of the orb with its letter baked in, shared by all power-ups of a type
+        tex = textures.get(("powerup", self.type))
+        if tex is None:
+            # colored orb with outline and the type's initial, rendered once per type
+            r = self.radius
+            s = pygame.Surface((2 * r + 1, 2 * r + 1), pygame.SRCALPHA)
+            c = POWERUP_COLORS.get(self.type, (255, 255, 255))
+            pygame.draw.circle(s, c, (r, r), r)
+            pygame.draw.circle(s, (10, 10, 10), (r, r), r, 2)
+            s.blit(_get_font(20).render(self.type[0].upper(), True, (10, 10, 10)), (r - 6, r - 10))
+            tex = textures.put(("powerup", self.type), textures.upload(s))
+        tex.draw(dstrect=(int(self.x) - self.radius, int(self.y) - self.radius))
 
     def collides_with_circle(self, circle):
         cx, cy, cr = circle
@@ -271,33 +421,97 @@ class PowerUp:
         return dx * dx + dy * dy <= (cr + self.radius) ** 2
 
 
-class Particle:
-    """Very simple particle for visual effects (on pickup/crash)."""
+class Particles:
+    """Pool of simple particles for visual effects (on pickup/crash).
+    Stored as parallel NumPy arrays (one entry per particle) so the per-frame physics is a
+    handful of vectorized operations instead of a Python loop over particle objects.
+    """
 
-    def __init__(self, x, y, color, vx, vy, life):
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.life = life
-        self.max_life = life
+    FLOAT_FIELDS = ("x", "y", "vx", "vy", "life", "max_life")
+    FIELDS = FLOAT_FIELDS + ("color",)  # every per-particle array
+
+    def __init__(self, capacity=256):
+        self.n = 0  # number of live particles (always the first n rows)
+        self.capacity = capacity
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.empty(capacity, dtype=np.float32))
+        self.color = np.empty((capacity, 3), dtype=np.uint8)
+
+    def _grow(self, capacity):
+        """Reallocate every array with a larger capacity, keeping the live rows."""
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.n
+
+    def append_block(self, x, y, color, vx, vy, life):
+        """Add len(vx) particles starting at (x, y) with a shared color."""
+        count = len(vx)
+        if self.n + count > self.capacity:
+            cap = self.capacity
+            while cap < self.n + count:
+                cap *= 2
+            self._grow(cap)
+        a, b = self.n, self.n + count
+        self.x[a:b] = x
+        self.y[a:b] = y
+        self.vx[a:b] = vx
+        self.vy[a:b] = vy
+        self.life[a:b] = life
+        self.max_life[a:b] = life
+        self.color[a:b] = color
+        self.n = b
 
     def update(self, dt):
-        self.vy += 300 * dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.life -= dt
-
-    def draw(self, surf):
-        if self.life <= 0:
+        """Integrate all live particles at once and drop the ones whose life ran out."""
+        n = self.n
+        if n == 0:
             return
-        alpha = clamp(self.life / self.max_life, 0.0, 1.0)
-        r = int(3 + 5 * alpha)
-        s = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-        col = (*self.color, int(255 * alpha))
-        pygame.draw.circle(s, col, (r, r), r)
-        surf.blit(s, (int(self.x - r), int(self.y - r)))
+        self.vy[:n] += 300 * dt
+        self.x[:n] += self.vx[:n] * dt
+        self.y[:n] += self.vy[:n] * dt
+        self.life[:n] -= dt
+
+        alive = self.life[:n] > 0
+        if not alive.all():
+            # compact survivors to the front of every array
+            k = int(alive.sum())
+            for name in self.FIELDS:
+                arr = getattr(self, name)
+                arr[:k] = arr[:n][alive]
+            self.n = k
+
+    def _textures(self, textures, color):
+        """Return opaque circle textures for every radius a particle can have (3..8 px).
+        They are rendered once per color; fading is done with the texture's alpha at draw time.
+        """
+        texs = textures.get(("particle", color))
+        if texs is None:
+            texs = [None] * (PARTICLE_MAX_RADIUS + 1)
+            for r in range(PARTICLE_MIN_RADIUS, PARTICLE_MAX_RADIUS + 1):
+                t = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+                pygame.draw.circle(t, color, (r, r), r)
+                texs[r] = textures.upload(t)
+            textures.put(("particle", color), texs)
+        return texs
+
+    def draw(self, textures):
+        n = self.n
+        if n == 0:
+            return
+        alpha = np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0)
+        radii = (PARTICLE_MIN_RADIUS + (PARTICLE_MAX_RADIUS - PARTICLE_MIN_RADIUS) * alpha).astype(np.int32)
+        alphas = (255 * alpha).astype(np.int32)
+        for x, y, a, r, col in zip(self.x[:n].tolist(), self.y[:n].tolist(), alphas.tolist(),
+                                   radii.tolist(), self.color[:n].tolist()):
+            t = self._textures(textures, tuple(col))[r]
+            t.alpha = a
+            t.draw(dstrect=(int(x - r), int(y - r)))
 
 
 # -----------------------------
@@ -310,15 +524,34 @@ class Game:
     """
 
     def __init__(self):
-        # initialize pygame and create the window
+        # initialize pygame and create the window with a (GPU accelerated, when available)
+        # SDL2 renderer. Everything is drawn as textures so SDL can batch the draw calls.
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
-        pygame.display.set_caption("Complex Colorful Bird Jump")
+        self.window = Window("Complex Colorful Bird Jump", (WIDTH, HEIGHT))
+        self.renderer = Renderer(self.window)
+        # every texture drawn through the renderer; owned here so it goes away with the game
+        self.textures = TextureCache(self.renderer)
         self.clock = pygame.time.Clock()
 
+        # pre-render the static sky gradient once; draw_background just draws it
+        self.bg_texture = self.to_texture(self.make_background())
+        # same for the ground tiles, which only ever scroll horizontally
+        self.ground_texture = self.to_texture(self.make_ground())
+
+        # build every font size the game uses up front so draw_text never hits SysFont mid-game
+        for size in FONT_SIZES:
+            _get_font(size)
+
         # base font used across the game
-        self.font = pygame.font.SysFont(None, 30)
-        self.large_font = pygame.font.SysFont(None, 56)
+        self.font = _get_font(30)
+        self.large_font = _get_font(56)
+
+        # static overlays for the non-playing states
+        self._overlay = {state: self.to_texture(o) for state, o in self.make_overlays().items()}
+        # HUD icons (lives, active powerups)
+        pip, icons = self.make_hud_icons()
+        self._life_pip = self.to_texture(pip)
+        self._powerup_icons = {k: self.to_texture(icon) for k, icon in icons.items()}
 
         # load or initialize persistent high score
         self.high_score = load_highscore()
@@ -327,13 +560,17 @@ class Game:
         self.reset()
 
         # Prepare parallax clouds for background
+        # each cloud keeps a reference to its pre-rendered texture (shared per radius)
+        self._cloud_texs = {}
         self.clouds = [
             {"x": random.randint(0, WIDTH), "y": random.randint(20, 200), "r": random.randint(20, 45), "speed": random.uniform(10, 40)}
             for _ in range(10)
         ]
+        for c in self.clouds:
+            c["tex"] = self.cloud_texture(c["r"])
 
-        # particle list
-        self.particles = []
+        # particle pool (NumPy-backed, see Particles)
+        self.particles = Particles()
 
         # Sound toggles and placeholders
         self.sound_on = True
@@ -345,9 +582,12 @@ class Game:
         self.pipes = []
         self.powerups = []
         self.score = 0
+        # cached difficulty multiplier, recomputed only when the score changes (see add_score)
+        self.difficulty_factor = 1.0
         self.lives = START_LIVES
         self.invulnerable_timer = 0.0
-        self.powerup_timers = {}  # e.g., {"shield": remaining_seconds}
+        # remaining seconds per powerup type; every type is always present (0.0 = inactive)
+        self.powerup_timers = {k: 0.0 for k in POWERUP_TYPES}
 
         # difficulty scaling variables
         self.pipe_speed = PIPE_SPEED_BASE
@@ -360,6 +600,7 @@ class Game:
 
         # timers
         self.last_time = time.time()
+        self.bob_phase = 0.0  # powerup bobbing phase, shared by all powerups
 
     # -----------------------------
     # STATE MANAGEMENT / INPUT
@@ -423,61 +664,77 @@ class Game:
         elif ptype == "score":
             self.powerup_timers["score"] = POWERUP_DURATION
 
+    def add_score(self, points):
+        """Add points to the score and refresh the difficulty factor derived from it."""
+        self.score += points
+        self.difficulty_factor = 1.0 + math.log(1 + max(0, self.score)) * 0.05
+
     def spawn_particles(self, x, y, color, count=20):
         """Create many small particles for visual flair at (x,y)."""
-        for _ in range(count):
-            vx = random.uniform(-220, 220)
-            vy = random.uniform(-200, -40)
-            life = random.uniform(0.5, 1.2)
-            self.particles.append(Particle(x, y, color, vx, vy, life))
+        # draw all random values for the burst in three vectorized calls
+        vx = np.random.uniform(-220, 220, count)
+        vy = np.random.uniform(-200, -40, count)
+        life = np.random.uniform(0.5, 1.2, count)
+        self.particles.append_block(x, y, color, vx, vy, life)
 
     def handle_collisions(self):
         """Check collisions between bird and pipes/powerups and react accordingly."""
         # circle representing bird
         circ = self.bird.get_circle()
+        # broad phase: the bird only spans [lo, hi] horizontally, so anything outside
+        # that x-range can be rejected before the exact circle tests
+        bx, br = self.bird.x, self.bird.radius
+        lo, hi = bx - br, bx + br
 
         # PowerUp collisions: pick up and apply
-        for pu in list(self.powerups):
+        # walk backwards so collected ones can be swap-popped without a scan or copy
+        for i in range(len(self.powerups) - 1, -1, -1):
+            pu = self.powerups[i]
+            if abs(pu.x - bx) > br + pu.radius:
+                continue
             if pu.collides_with_circle(circ):
                 self.apply_powerup(pu.type)
                 pu.collected = True
-                self.powerups.remove(pu)
+                self.powerups[i] = self.powerups[-1]
+                self.powerups.pop()
                 # visual + score feedback
                 self.spawn_particles(self.bird.x, self.bird.y, POWERUP_COLORS.get(pu.type, (255, 255, 255)), 18)
                 if pu.type == "score":
-                    self.score += 2
+                    self.add_score(2)
 
-        # Pipe collisions: only if not invulnerable and not shielded
-        if self.invulnerable_timer <= 0.0 and self.powerup_timers.get("shield", 0.0) <= 0.0:
-            for pipe in self.pipes:
-                if pipe.collides_with_circle(circ):
-                    # bird hit a pipe -> lose a life
-                    self.lives -= 1
-                    self.invulnerable_timer = INVULNERABILITY_AFTER_HIT
-                    # give a small bounce back
-                    self.bird.vel = -160
-                    self.spawn_particles(self.bird.x, self.bird.y, (255, 80, 80), 30)
-                    if self.lives <= 0:
-                        self.state = "GAME_OVER"
-                        # check highscore
-                        if self.score > self.high_score:
-                            self.high_score = self.score
-                            save_highscore(self.high_score)
-                    break
+        # evaluate protection once (after pickups, which may have just granted a shield);
+        # a hit below makes the bird invulnerable, so it also sets this flag
+        protected = self.invulnerable_timer > 0.0 or self.powerup_timers["shield"] > 0.0
 
-        # ground collision (if bird hits the ground)
-        if self.bird.y + self.bird.radius >= HEIGHT - 30:
-            if self.invulnerable_timer <= 0.0 and self.powerup_timers.get("shield", 0.0) <= 0.0:
+        # Pipe collisions: only if not invulnerable and not shielded
+        if not protected:
+            if first_pipe_hit(circ, self.pipes, lo, hi) >= 0:
+                # bird hit a pipe -> lose a life
                 self.lives -= 1
                 self.invulnerable_timer = INVULNERABILITY_AFTER_HIT
-                self.spawn_particles(self.bird.x, self.bird.y, (255, 80, 80), 18)
-                self.bird.vel = -120
+                protected = True
+                # give a small bounce back
+                self.bird.vel = -160
+                self.spawn_particles(self.bird.x, self.bird.y, (255, 80, 80), 30)
                 if self.lives <= 0:
                     self.state = "GAME_OVER"
+                    # check highscore
                     if self.score > self.high_score:
                         self.high_score = self.score
                         save_highscore(self.high_score)
 
+        # ground collision (if bird hits the ground)
+        if not protected and self.bird.y + self.bird.radius >= HEIGHT - 30:
+            self.lives -= 1
+            self.invulnerable_timer = INVULNERABILITY_AFTER_HIT
+            self.spawn_particles(self.bird.x, self.bird.y, (255, 80, 80), 18)
+            self.bird.vel = -120
+            if self.lives <= 0:
+                self.state = "GAME_OVER"
+                if self.score > self.high_score:
+                    self.high_score = self.score
+                    save_highscore(self.high_score)
+
     # -----------------------------
     # UPDATE / DRAW LOOP
     # -----------------------------
@@ -496,8 +753,8 @@ class Game:
         self.time_since_last_pipe += dt
 
         # difficulty scaling by score: as score increases, pipes get faster and spacing tighter
-        difficulty_factor = 1.0 + math.log(1 + max(0, self.score)) * 0.05
-        speed = self.pipe_speed * difficulty_factor * (0.6 if self.powerup_timers.get("slow", 0.0) > 0.0 else 1.0)
+        difficulty_factor = self.difficulty_factor
+        speed = self.pipe_speed * difficulty_factor * (0.6 if self.powerup_timers["slow"] > 0.0 else 1.0)
         spawn_interval = max(1.0, self.pipe_spawn_interval / difficulty_factor)
 
         # spawn pipes at intervals
@@ -505,47 +762,45 @@ class Game:
             self.spawn_pipe()
             self.time_since_last_pipe = 0.0
 
+        # advance the shared powerup bobbing phase (4 rad/s)
+        self.bob_phase += 4.0 * dt
+
         # update bird physics
         self.bird.update(dt)
 
-        # update pipes
-        for pipe in list(self.pipes):
+        # update pipes (backwards, so off-screen ones can be swap-popped in place;
+        # pipe order doesn't matter for drawing or scoring)
+        for i in range(len(self.pipes) - 1, -1, -1):
+            pipe = self.pipes[i]
             pipe.update(dt, speed)
             # scoring: if pipe passed left of bird and not yet counted
             if not pipe.passed and pipe.x + pipe.width < self.bird.x:
                 pipe.passed = True
-                self.score += 1
+                self.add_score(1)
                 # visual: spawn confetti particles
                 self.spawn_particles(self.bird.x, self.bird.y, (180, 255, 200), 8)
             if pipe.off_screen():
-                self.pipes.remove(pipe)
+                self.pipes[i] = self.pipes[-1]
+                self.pipes.pop()
 
         # update power-ups
-        for pu in list(self.powerups):
-            pu.update(dt, speed)
+        for i in range(len(self.powerups) - 1, -1, -1):
+            pu = self.powerups[i]
+            pu.update(dt, speed, self.bob_phase)
             if pu.x < -40:
-                self.powerups.remove(pu)
+                self.powerups[i] = self.powerups[-1]
+                self.powerups.pop()
 
         # update particles and cull dead
-        for p in list(self.particles):
-            p.update(dt)
-            if p.life <= 0:
-                try:
-                    self.particles.remove(p)
-                except ValueError:
-                    pass
+        self.particles.update(dt)
 
         # update invulnerability and powerup timers
         if self.invulnerable_timer > 0.0:
             self.invulnerable_timer -= dt
 
-        to_del = []
-        for k, t in self.powerup_timers.items():
-            self.powerup_timers[k] = t - dt
-            if self.powerup_timers[k] <= 0.0:
-                to_del.append(k)
-        for k in to_del:
-            del self.powerup_timers[k]
+        timers = self.powerup_timers
+        for k in timers:
+            timers[k] = max(0.0, timers[k] - dt)
 
         # handle collisions after movement
         self.handle_collisions()
@@ -555,34 +810,102 @@ class Game:
             self.bird.y = 20
             self.bird.vel = 0
 
-    def draw_background(self):
-        """Draw gradient sky and parallax cloud layers. We fill from top to bottom."""
-        # vertical linear gradient between SKY_TOP and SKY_BOTTOM
+    def make_background(self):
+        """Render the gradient sky into an off-screen surface. The gradient never changes,
+        so we pay for the line draws once here instead of every frame.
+        """
+        bg = pygame.Surface((WIDTH, HEIGHT))
+        # vertical linear gradient between SKY_TOP and SKY_BOTTOM (upper half)
         for i in range(HEIGHT // 2):
             u = i / (HEIGHT // 2)
             r = int(SKY_TOP[0] * (1 - u) + SKY_BOTTOM[0] * u)
             g = int(SKY_TOP[1] * (1 - u) + SKY_BOTTOM[1] * u)
             b = int(SKY_TOP[2] * (1 - u) + SKY_BOTTOM[2] * u)
-            pygame.draw.line(self.screen, (r, g, b), (0, i), (WIDTH, i))
-        # lower half
-        for i in range(HEIGHT // 2, HEIGHT):
-            self.screen.fill(SKY_BOTTOM, (0, i, WIDTH, 1))
+            pygame.draw.line(bg, (r, g, b), (0, i), (WIDTH, i))
+        # lower half is a flat fill
+        bg.fill(SKY_BOTTOM, (0, HEIGHT // 2, WIDTH, HEIGHT - HEIGHT // 2))
+        return bg
+
+    def to_texture(self, surf):
+        """Upload a pre-rendered surface to the renderer as a texture."""
+        return self.textures.upload(surf)
+
+    def cloud_texture(self, r):
+        """Return the texture for a cloud of radius r: a main puff plus a smaller puff
+        up and to the right. Rendered once per radius and reused.
+        """
+        tex = self._cloud_texs.get(r)
+        if tex is None:
+            surf = pygame.Surface((int(r * 2.3) + 2, r * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (255, 255, 255), (r, r), r)
+            pygame.draw.circle(surf, (250, 250, 250), (r + int(r * 0.6), int(r - r * 0.1)), int(r * 0.7))
+            tex = self._cloud_texs[r] = self.to_texture(surf)
+        return tex
+
+    def draw_background(self):
+        """Draw gradient sky and parallax cloud layers."""
+        # cached gradient sky
+        self.bg_texture.draw(dstrect=(0, 0))
 
         # clouds
         for c in self.clouds:
             x = int(c["x"]) % (WIDTH + 200) - 100
-            pygame.draw.circle(self.screen, (255, 255, 255), (x, int(c["y"])), c["r"])
-            pygame.draw.circle(self.screen, (250, 250, 250), (x + int(c["r"] * 0.6), int(c["y"] - c["r"] * 0.1)), int(c["r"] * 0.7))
+            # sprite origin is the top-left of the main puff's bounding box
+            c["tex"].draw(dstrect=(x - c["r"], int(c["y"]) - c["r"]))
+
+    def make_overlays(self):
+        """Pre-render the semi-transparent MENU / PAUSED / GAME_OVER overlays with their static
+        text baked in, so each overlay frame is a single texture draw.
+        """
+        def overlay(fill):
+            o = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            o.fill(fill)
+            return o
+
+        # semi-transparent overlay for menu
+        menu = overlay((255, 255, 255, 200))
+        draw_text(menu, "Complex Colorful Bird Jump", 42, (WIDTH // 2, HEIGHT // 2 - 60), color=(30, 30, 30), center=True)
+        draw_text(menu, "Press SPACE to start", 28, (WIDTH // 2, HEIGHT // 2), color=(30, 30, 30), center=True)
+        draw_text(menu, "SPACE = Flap | P = Pause | M = Mute | R = Restart (game over)", 20, (WIDTH // 2, HEIGHT // 2 + 50), color=(30, 30, 30), center=True)
+
+        paused = overlay((0, 0, 0, 140))
+        draw_text(paused, "Paused", 48, (WIDTH // 2, HEIGHT // 2), color=(255, 255, 255), center=True)
+
+        # the score line is drawn per frame on top of this one
+        game_over = overlay((0, 0, 0, 180))
+        draw_text(game_over, "Game Over", 56, (WIDTH // 2, HEIGHT // 2 - 40), color=(255, 255, 255), center=True)
+        draw_text(game_over, "Press R to restart or Q to quit", 22, (WIDTH // 2, HEIGHT // 2 + 60), color=(255, 255, 255), center=True)
+
+        return {"MENU": menu, "PAUSED": paused, "GAME_OVER": game_over}
+
+    def make_hud_icons(self):
+        """Pre-render the HUD's life pip and one icon per powerup type."""
+        pip = pygame.Surface((17, 17), pygame.SRCALPHA)
+        pygame.draw.circle(pip, (255, 80, 80), (8, 8), 8)
+        pygame.draw.circle(pip, (10, 10, 10), (8, 8), 8, 1)
+
+        icons = {}
+        for k, c in POWERUP_COLORS.items():
+            icon = pygame.Surface((25, 25), pygame.SRCALPHA)
+            pygame.draw.circle(icon, c, (12, 12), 12)
+            icons[k] = icon
+        return pip, icons
+
+    def make_ground(self):
+        """Render one strip of ground with its tiles, one tile period wider than the screen,
+        so draw_ground can scroll it with a single texture draw.
+        """
+        strip = pygame.Surface((WIDTH + GROUND_TILE_W, GROUND_HEIGHT))
+        strip.fill(GROUND_COLOR)
+        # simple tile shapes to show movement
+        for x in range(0, WIDTH + GROUND_TILE_W, GROUND_TILE_W):
+            pygame.draw.rect(strip, (100, 65, 40), (x + 10, 10, GROUND_TILE_W - 18, GROUND_HEIGHT - 20))
+        return strip
 
     def draw_ground(self):
-        """Draw a repeating ground band at the bottom with simple tiles for motion impression."""
-        ground_h = 90
-        pygame.draw.rect(self.screen, GROUND_COLOR, (0, HEIGHT - ground_h, WIDTH, ground_h))
-        # draw simple tile shapes to show movement
-        tile_w = 40
-        offset = (pygame.time.get_ticks() // 10) % tile_w
-        for x in range(-tile_w + offset, WIDTH, tile_w):
-            pygame.draw.rect(self.screen, (100, 65, 40), (x + 10, HEIGHT - ground_h + 10, tile_w - 18, ground_h - 20))
+        """Draw the repeating ground band at the bottom, offset over time for motion impression."""
+        offset = (pygame.time.get_ticks() // 10) % GROUND_TILE_W
+        self.ground_texture.draw(dstrect=(offset - GROUND_TILE_W, HEIGHT - GROUND_HEIGHT))
 
     def draw(self):
         """Draw everything: background, pipes, power-ups, bird, particles, and UI."""
@@ -590,73 +913,60 @@ class Game:
         self.draw_background()
 
         # pipes behind bird (but their drawing order doesn't matter much visually)
+        # (skip ones not yet scrolled in or already scrolled out; they'd be fully clipped)
         for pipe in self.pipes:
-            pipe.draw(self.screen)
+            if pipe.x >= WIDTH or pipe.x + pipe.width < 0:
+                continue
+            pipe.draw(self.textures)
 
         # powerups
         for pu in self.powerups:
-            pu.draw(self.screen)
+            if pu.x < -pu.radius or pu.x > WIDTH + pu.radius:
+                continue
+            pu.draw(self.textures)
 
         # particles under the bird so they appear behind in depth
-        for p in self.particles:
-            p.draw(self.screen)
+        self.particles.draw(self.textures)
 
         # bird with slight tilt multiplier if slow effect is active
-        angle_mul = 0.7 if "slow" in self.powerup_timers else 1.0
+        angle_mul = 0.7 if self.powerup_timers["slow"] > 0.0 else 1.0
         # if invulnerable show blinking by skipping draw some frames
         if self.invulnerable_timer > 0.0 and int(self.invulnerable_timer * 10) % 2 == 0:
             # skip draw to indicate blink
             pass
         else:
-            self.bird.draw(self.screen, angle_mul=angle_mul)
+            self.bird.draw(self.textures, angle_mul=angle_mul)
 
         # draw HUD: score, highscore, lives
-        draw_text(self.screen, f"Score: {self.score}", 28, (12, 12), color=(20, 20, 20))
-        draw_text(self.screen, f"High: {self.high_score}", 20, (12, 44), color=(20, 20, 20))
-
-        # lives display
-        for i in range(self.lives):
-            x = WIDTH - 20 - i * 28
-            y = 24
-            pygame.draw.circle(self.screen, (255, 80, 80), (x, y), 8)
-            pygame.draw.circle(self.screen, (10, 10, 10), (x, y), 8, 1)
-
-        # active powerups
-        if self.powerup_timers:
-            y = 80
-            for k, t in self.powerup_timers.items():
-                c = POWERUP_COLORS.get(k, (255, 255, 255))
-                pygame.draw.circle(self.screen, c, (WIDTH - 32, y), 12)
-                draw_text(self.screen, f"{k} {int(t)}s", 18, (WIDTH - 88, y - 12), color=(10, 10, 10))
-                y += 28
+        draw_text(self.textures, f"Score: {self.score}", 28, (12, 12), color=(20, 20, 20))
+        draw_text(self.textures, f"High: {self.high_score}", 20, (12, 44), color=(20, 20, 20))
+
+        # lives display + active powerups, collected into one list and drawn back to back
+        # (consecutive texture draws get batched by the renderer)
+        hud = [(self._life_pip, (WIDTH - 28 - i * 28, 16)) for i in range(self.lives)]
+        y = 80
+        for k, t in self.powerup_timers.items():
+            if t <= 0.0:
+                continue
+            hud.append((self._powerup_icons[k], (WIDTH - 44, y - 12)))
+            hud.append((self.textures.text(f"{k} {int(t)}s", 18, (10, 10, 10)), (WIDTH - 88, y - 12)))
+            y += 28
+        for tex, pos in hud:
+            tex.draw(dstrect=pos)
 
         # draw ground
         self.draw_ground()
 
-        # overlays for MENU / PAUSE / GAME OVER
-        if self.state == "MENU":
-            # semi-transparent overlay for menu
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 200))
-            self.screen.blit(overlay, (0, 0))
-            draw_text(self.screen, "Complex Colorful Bird Jump", 42, (WIDTH // 2, HEIGHT // 2 - 60), color=(30, 30, 30), center=True)
-            draw_text(self.screen, "Press SPACE to start", 28, (WIDTH // 2, HEIGHT // 2), color=(30, 30, 30), center=True)
-            draw_text(self.screen, "SPACE = Flap | P = Pause | M = Mute | R = Restart (game over)", 20, (WIDTH // 2, HEIGHT // 2 + 50), color=(30, 30, 30), center=True)
-        elif self.state == "PAUSED":
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 140))
-            self.screen.blit(overlay, (0, 0))
-            draw_text(self.screen, "Paused", 48, (WIDTH // 2, HEIGHT // 2), color=(255, 255, 255), center=True)
-        elif self.state == "GAME_OVER":
-            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-            draw_text(self.screen, "Game Over", 56, (WIDTH // 2, HEIGHT // 2 - 40), color=(255, 255, 255), center=True)
-            draw_text(self.screen, f"Score: {self.score}", 34, (WIDTH // 2, HEIGHT // 2 + 10), color=(255, 255, 255), center=True)
-            draw_text(self.screen, "Press R to restart or Q to quit", 22, (WIDTH // 2, HEIGHT // 2 + 60), color=(255, 255, 255), center=True)
-
-        # final flip
-        pygame.display.flip()
+        # overlays for MENU / PAUSE / GAME OVER (pre-rendered, see make_overlays)
+        overlay = self._overlay.get(self.state)
+        if overlay is not None:
+            overlay.draw(dstrect=(0, 0))
+        if self.state == "GAME_OVER":
+            # the score is the only dynamic line on any overlay
+            draw_text(self.textures, f"Score: {self.score}", 34, (WIDTH // 2, HEIGHT // 2 + 10), color=(255, 255, 255), center=True)
+
+        # present the frame
+        self.renderer.present()
 
     # -----------------------------
     # RUN / QUIT